@@ -419,6 +419,13 @@ def logs(obj, input_path, stdout=None, stderr=None, both=None, timestamps=False)
     "--input-paths",
     help="A comma-separated list of pathspecs " "specifying inputs for this step.",
 )
+@click.option(
+    "--input-paths-key",
+    default=None,
+    hidden=True,
+    help="Datastore key of the input paths for this step, used instead of "
+    "--input-paths when they are too large to pass on the command line.",
+)
 @click.option(
     "--split-index",
     type=int,
@@ -484,6 +491,7 @@ def step(
     run_id=None,
     task_id=None,
     input_paths=None,
+    input_paths_key=None,
     split_index=None,
     opt_namespace=None,
     retry_count=None,
@@ -520,6 +528,9 @@ def step(
     cli_args._set_step_kwargs(step_kwargs)
 
     ctx.obj.metadata.add_sticky_tags(tags=opt_tag)
+    if input_paths_key:
+        _, blob = next(ctx.obj.flow_datastore.load_data([input_paths_key]))
+        input_paths = blob.decode("utf-8")
     paths = decompress_list(input_paths) if input_paths else []
 
     task = MetaflowTask(
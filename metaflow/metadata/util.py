@@ -2,8 +2,6 @@ from io import BytesIO
 import os
 import tarfile
 
-from distutils.dir_util import copy_tree
-
 from metaflow import util
 from metaflow.datastore.local_storage import LocalStorage
 
@@ -20,6 +18,10 @@ def sync_local_metadata_to_datastore(metadata_local_dir, task_ds):
 
 
 def sync_local_metadata_from_datastore(metadata_local_dir, task_ds):
+    # distutils is only needed here; importing it lazily keeps it out of the
+    # import path of every CLI command that merely references this module.
+    from distutils.dir_util import copy_tree
+
     def echo_none(*args, **kwargs):
         pass
 
@@ -1,6 +1,8 @@
 import math
 import time
 
+from threading import Thread
+
 from .mflog import refine, set_should_persist
 
 from metaflow.util import to_unicode
@@ -108,28 +110,47 @@ def export_mflog_env_vars(
 
 
 def tail_logs(prefix, stdout_tail, stderr_tail, echo, has_log_updates):
-    def _available_logs(tail, stream, echo, should_persist=False):
+    def _fetch_lines(tail, result):
+        # iterating over a tail issues its (ranged) fetch of new log bytes
+        try:
+            result.append((list(tail), None))
+        except Exception as ex:
+            result.append(([], ex))
+
+    def _available_logs(lines, ex, stream, echo, should_persist=False):
         # print the latest batch of lines
         try:
-            for line in tail:
+            for line in lines:
                 if should_persist:
                     line = set_should_persist(line)
                 else:
                     line = refine(line, prefix=prefix)
                 echo(line.strip().decode("utf-8", errors="replace"), stream)
-        except Exception as ex:
+        except Exception as err:
+            ex = err
+        if ex is not None:
             echo(
                 "%s[ temporary error in fetching logs: %s ]" % (to_unicode(prefix), ex),
                 "stderr",
             )
 
+    def _all_available_logs():
+        # fetch stderr in the background while fetching stdout, so that both
+        # streams are polled in one round-trip instead of two
+        stdout_result, stderr_result = [], []
+        stderr_fetcher = Thread(target=_fetch_lines, args=(stderr_tail, stderr_result))
+        stderr_fetcher.start()
+        _fetch_lines(stdout_tail, stdout_result)
+        stderr_fetcher.join()
+        _available_logs(*stdout_result[0], stream="stdout", echo=echo)
+        _available_logs(*stderr_result[0], stream="stderr", echo=echo)
+
     start_time = time.time()
     next_log_update = start_time
     log_update_delay = 1
     while has_log_updates():
         if time.time() > next_log_update:
-            _available_logs(stdout_tail, "stdout", echo)
-            _available_logs(stderr_tail, "stderr", echo)
+            _all_available_logs()
             now = time.time()
             log_update_delay = update_delay(now - start_time)
             next_log_update = now + log_update_delay
@@ -140,5 +161,4 @@ def tail_logs(prefix, stdout_tail, stderr_tail, echo, has_log_updates):
         time.sleep(min(log_update_delay, 5.0))
     # It is possible that we exit the loop above before all logs have been
     # tailed.
-    _available_logs(stdout_tail, "stdout", echo)
-    _available_logs(stderr_tail, "stderr", echo)
+    _all_available_logs()
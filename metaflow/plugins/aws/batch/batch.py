@@ -5,6 +5,16 @@ import select
 import shlex
 import time
 
+from itertools import islice
+from threading import Thread
+
+try:
+    # python2
+    from Queue import Queue, Empty
+except:
+    # python3
+    from queue import Queue, Empty
+
 from metaflow import util
 from metaflow.datatools.s3tail import S3Tail
 from metaflow.exception import MetaflowException, MetaflowInternalError
@@ -25,7 +35,7 @@ from metaflow.mflog import (
     BASH_SAVE_LOGS,
 )
 
-from .batch_client import BatchClient
+from .batch_client import BatchClient, MAX_POOL_CONNECTIONS
 
 # Redirect structured logs to $PWD/.logs/
 LOGS_DIR = "$PWD/.logs"
@@ -34,6 +44,11 @@ STDERR_FILE = "mflog_stderr"
 STDOUT_PATH = os.path.join(LOGS_DIR, STDOUT_FILE)
 STDERR_PATH = os.path.join(LOGS_DIR, STDERR_FILE)
 
+# Number of worker threads `batch kill` terminates jobs with. All of them
+# share one boto3 client, so use one worker per pooled connection; more
+# workers would only overflow the pool and open throwaway connections.
+KILL_JOBS_MAX_WORKERS = MAX_POOL_CONNECTIONS
+
 
 class BatchException(MetaflowException):
     headline = "AWS Batch error"
@@ -95,10 +110,11 @@ class Batch(object):
             regex = "-{flow_name}-".format(flow_name=flow_name)
         else:
             regex = "{user}-{flow_name}-".format(user=user, flow_name=flow_name)
-        jobs = []
-        for job in self._client.unfinished_jobs():
-            if regex in job["jobName"]:
-                jobs.append(job["jobId"])
+        jobs = (
+            job["jobId"]
+            for job in self._client.unfinished_jobs()
+            if regex in job["jobName"]
+        )
         if run_id is not None:
             run_id = run_id[run_id.startswith("sfn-") and len("sfn-") :]
         for job in self._client.describe_jobs(jobs):
@@ -135,24 +151,61 @@ class Batch(object):
             echo("No running AWS Batch jobs found.")
 
     def kill_jobs(self, flow_name, run_id, user, echo):
+        def _kill(job):
+            try:
+                self._client.terminate_job(job["jobId"])
+                return job, None
+            except Exception as e:
+                return job, e
+
+        def _kill_all(batch):
+            # Terminations are independent, network-bound calls - issue them
+            # from a pool of worker threads and return results in order.
+            results = [None] * len(batch)
+            pending = Queue()
+            for i in range(len(batch)):
+                pending.put(i)
+
+            def _worker():
+                while True:
+                    try:
+                        i = pending.get_nowait()
+                    except Empty:
+                        return
+                    results[i] = _kill(batch[i])
+
+            workers = [
+                Thread(target=_worker)
+                for _ in range(min(KILL_JOBS_MAX_WORKERS, len(batch)))
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            return results
+
         jobs = self._search_jobs(flow_name, run_id, user)
         found = False
-        for job in jobs:
+        # Kill a batch of found jobs at a time
+        while True:
+            batch = list(islice(jobs, 100))
+            if not batch:
+                break
             found = True
-            try:
-                self._client.attach_job(job["jobId"]).kill()
-                echo(
-                    "Killing AWS Batch job: {name} [{id}] ({status})".format(
-                        name=job["jobName"],
-                        id=job["jobId"],
-                        status=job["status"],
+            for job, e in _kill_all(batch):
+                if e is None:
+                    echo(
+                        "Killing AWS Batch job: {name} [{id}] ({status})".format(
+                            name=job["jobName"],
+                            id=job["jobId"],
+                            status=job["status"],
+                        )
+                    )
+                else:
+                    echo(
+                        "Failed to terminate AWS Batch job %s [%s]"
+                        % (job["jobId"], repr(e))
                     )
-                )
-            except Exception as e:
-                echo(
-                    "Failed to terminate AWS Batch job %s [%s]"
-                    % (job["jobId"], repr(e))
-                )
         if not found:
             echo("No running AWS Batch jobs found.")
 
@@ -4,7 +4,8 @@ import sys
 import time
 import traceback
 
-from distutils.dir_util import copy_tree
+from functools import wraps
+from itertools import chain
 
 from metaflow import util
 from metaflow import R
@@ -49,21 +50,37 @@ def _execute_cmd(func, flow_name, run_id, user, my_runs, echo):
     func(flow_name, run_id, user, echo)
 
 
-@batch.command(help="List unfinished AWS Batch tasks of this flow")
-@click.option(
-    "--my-runs",
-    default=False,
-    is_flag=True,
-    help="List all my unfinished tasks.",
-)
-@click.option("--user", default=None, help="List unfinished tasks for the given user.")
-@click.option(
-    "--run-id",
-    default=None,
-    help="List unfinished tasks corresponding to the run id.",
-)
+def common_job_options(verb):
+    def decorator(func):
+        @click.option(
+            "--my-runs",
+            default=False,
+            is_flag=True,
+            help="%s all my unfinished tasks." % verb,
+        )
+        @click.option(
+            "--user",
+            default=None,
+            help="%s unfinished tasks for the given user." % verb,
+        )
+        @click.option(
+            "--run-id",
+            default=None,
+            help="%s unfinished tasks corresponding to the run id." % verb,
+        )
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@batch.command("list", help="List unfinished AWS Batch tasks of this flow")
+@common_job_options("List")
 @click.pass_context
-def list(ctx, run_id, user, my_runs):
+def lst(ctx, run_id, user, my_runs):
     batch = Batch(ctx.obj.metadata, ctx.obj.environment)
     _execute_cmd(
         batch.list_jobs, ctx.obj.flow.name, run_id, user, my_runs, ctx.obj.echo
@@ -71,22 +88,7 @@ def list(ctx, run_id, user, my_runs):
 
 
 @batch.command(help="Terminate unfinished AWS Batch tasks of this flow.")
-@click.option(
-    "--my-runs",
-    default=False,
-    is_flag=True,
-    help="Kill all my unfinished tasks.",
-)
-@click.option(
-    "--user",
-    default=None,
-    help="Terminate unfinished tasks for the given user.",
-)
-@click.option(
-    "--run-id",
-    default=None,
-    help="Terminate unfinished tasks corresponding to the run id.",
-)
+@common_job_options("Terminate")
 @click.pass_context
 def kill(ctx, run_id, user, my_runs):
     batch = Batch(ctx.obj.metadata, ctx.obj.environment)
@@ -164,11 +166,16 @@ def step(
     host_volumes=None,
     **kwargs
 ):
+    echo_always = ctx.obj.echo_always
+
+    # Called for every log line tailed from the task; tail_logs already hands
+    # over decoded lines, so only convert what isn't unicode yet.
     def echo(msg, stream="stderr", batch_id=None):
-        msg = util.to_unicode(msg)
+        if not isinstance(msg, util.unicode_type):
+            msg = util.to_unicode(msg)
         if batch_id:
             msg = "[%s] %s" % (batch_id, msg)
-        ctx.obj.echo_always(msg, err=(stream == sys.stderr))
+        echo_always(msg, err=(stream == "stderr"))
 
     if R.use_r():
         entrypoint = R.entrypoint()
@@ -177,34 +184,46 @@ def step(
             executable = ctx.obj.environment.executable(step_name)
         entrypoint = "%s -u %s" % (executable, os.path.basename(sys.argv[0]))
 
-    top_args = " ".join(util.dict_to_cli_options(ctx.parent.parent.params))
-
     input_paths = kwargs.get("input_paths")
-    split_vars = None
+    input_paths_env = None
     if input_paths:
         max_size = 30 * 1024
-        split_vars = {
-            "METAFLOW_INPUT_PATHS_%d" % (i // max_size): input_paths[i : i + max_size]
-            for i in range(0, len(input_paths), max_size)
-        }
-        kwargs["input_paths"] = "".join("${%s}" % s for s in split_vars.keys())
-
-    step_args = " ".join(util.dict_to_cli_options(kwargs))
-    step_cli = u"{entrypoint} {top_args} step {step} {step_args}".format(
-        entrypoint=entrypoint,
-        top_args=top_args,
-        step=step_name,
-        step_args=step_args,
+        if len(input_paths) > max_size:
+            # Input paths of very wide joins don't fit in an environment
+            # variable; stash them in the datastore and pass the key instead.
+            [(_, key)] = ctx.obj.flow_datastore.save_data(
+                [util.to_bytes(input_paths)], len_hint=1
+            )
+            kwargs["input_paths"] = None
+            kwargs["input_paths_key"] = key
+        else:
+            input_paths_env = {"METAFLOW_INPUT_PATHS_0": input_paths}
+            kwargs["input_paths"] = "${METAFLOW_INPUT_PATHS_0}"
+
+    step_cli = " ".join(
+        chain(
+            [entrypoint],
+            util.dict_to_cli_options(ctx.parent.parent.params),
+            ["step", step_name],
+            util.dict_to_cli_options(kwargs),
+        )
     )
     node = ctx.obj.graph[step_name]
 
+    # Find the decorators we care about in a single pass
+    retry_deco = env_deco = None
+    for deco in node.decorators:
+        if deco.name == "retry":
+            retry_deco = deco
+        elif deco.name == "environment":
+            env_deco = deco
+
     # Get retry information
     retry_count = kwargs.get("retry_count", 0)
-    retry_deco = [deco for deco in node.decorators if deco.name == "retry"]
     minutes_between_retries = None
     if retry_deco:
         minutes_between_retries = int(
-            retry_deco[0].attributes.get("minutes_between_retries", 1)
+            retry_deco.attributes.get("minutes_between_retries", 1)
         )
 
     # Set batch attributes
@@ -221,25 +240,29 @@ def step(
         "metaflow_version"
     ]
 
-    env_deco = [deco for deco in node.decorators if deco.name == "environment"]
     if env_deco:
-        env = env_deco[0].attributes["vars"]
+        env = env_deco.attributes["vars"]
     else:
         env = {}
 
     # Add the environment variables related to the input-paths argument
-    if split_vars:
-        env.update(split_vars)
+    if input_paths_env:
+        env.update(input_paths_env)
 
+    # Start the retry backoff clock now and only sleep for whatever is left
+    # of it right before launching the job, so that the datastore and AWS
+    # Batch client setup below overlaps with the backoff window.
+    retry_deadline = None
     if retry_count:
         ctx.obj.echo_always(
             "Sleeping %d minutes before the next AWS Batch retry"
             % minutes_between_retries
         )
-        time.sleep(minutes_between_retries * 60)
+        retry_deadline = time.time() + minutes_between_retries * 60
 
     # this information is needed for log tailing
-    ds = ctx.obj.flow_datastore.get_task_datastore(
+    flow_datastore = ctx.obj.flow_datastore
+    ds = flow_datastore.get_task_datastore(
         mode="w",
         run_id=kwargs["run_id"],
         step_name=step_name,
@@ -250,15 +273,22 @@ def step(
     stderr_location = ds.get_log_location(TASK_LOG_SOURCE, "stderr")
 
     def _sync_metadata():
+        # `ds` is opened in write mode and can't load metadata, so a read-mode
+        # view on the same flow datastore is needed here. Both exit paths call
+        # this at most once per task (the launch failure path exits directly).
         if ctx.obj.metadata.TYPE == "local":
             sync_local_metadata_from_datastore(
                 DATASTORE_LOCAL_DIR,
-                ctx.obj.flow_datastore.get_task_datastore(
+                flow_datastore.get_task_datastore(
                     kwargs["run_id"], step_name, kwargs["task_id"]
                 ),
             )
 
     batch = Batch(ctx.obj.metadata, ctx.obj.environment)
+
+    if retry_deadline is not None:
+        time.sleep(max(0, retry_deadline - time.time()))
+
     try:
         with ctx.obj.monitor.measure("metaflow.aws.batch.launch_job"):
             batch.launch_job(
@@ -267,7 +297,7 @@ def step(
                 task_spec,
                 code_package_sha,
                 code_package_url,
-                ctx.obj.flow_datastore.TYPE,
+                flow_datastore.TYPE,
                 image=image,
                 queue=queue,
                 iam_role=iam_role,
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from collections import defaultdict, deque
+from itertools import islice
 import random
 import select
 import sys
@@ -15,12 +16,55 @@ except NameError:
 from metaflow.exception import MetaflowException
 from metaflow.metaflow_config import AWS_SANDBOX_ENABLED
 
+# Registering a job definition requires looking up the platform of the job
+# queue and whether an identical job definition already exists. Processes that
+# create many jobs (e.g. `step-functions create`) repeat these lookups for
+# every step, so the results are cached for a short while.
+CACHE_TTL_SECS = 60
+_platform_cache = {}
+_job_definition_cache = {}
+
+
+def _cache_get(cache, key):
+    entry = cache.get(key)
+    if entry is not None and time.time() - entry[0] < CACHE_TTL_SECS:
+        return entry[1]
+    return None
+
+
+def _cache_put(cache, key, value):
+    cache[key] = (time.time(), value)
+
+
+# The boto3 client is shared by all BatchClient instances in a process, since
+# creating one (loading endpoint data, resolving credentials) is expensive and
+# some commands (e.g. `step-functions create`) create a Batch object per step.
+# It is also used by the worker threads of `batch kill` (one per connection,
+# see KILL_JOBS_MAX_WORKERS in batch.py), hence the larger pool. The pool size
+# is handed to the configured AWS client provider as a botocore `config`
+# through the `params` of get_aws_client.
+MAX_POOL_CONNECTIONS = 32
+cached_batch_client = None
+
 
 class BatchClient(object):
     def __init__(self):
-        from ..aws_client import get_aws_client
+        global cached_batch_client
+        if cached_batch_client is None:
+            from ..aws_client import get_aws_client
+
+            try:
+                from botocore.config import Config
+            except ImportError:
+                raise MetaflowException(
+                    "Could not import module 'boto3'. Install boto3 first."
+                )
 
-        self._client = get_aws_client("batch")
+            cached_batch_client = get_aws_client(
+                "batch",
+                params={"config": Config(max_pool_connections=MAX_POOL_CONNECTIONS)},
+            )
+        self._client = cached_batch_client
 
     def active_job_queues(self):
         paginator = self._client.get_paginator("describe_job_queues")
@@ -44,7 +88,14 @@ class BatchClient(object):
         )
 
     def describe_jobs(self, job_ids):
-        for jobIds in [job_ids[i : i + 100] for i in range(0, len(job_ids), 100)]:
+        # job_ids may be a (lazy) iterable - describe jobs in batches of 100
+        # (the AWS Batch API limit) as soon as each batch fills up, rather than
+        # materializing every job id upfront.
+        job_ids = iter(job_ids)
+        while True:
+            jobIds = list(islice(job_ids, 100))
+            if not jobIds:
+                break
             for jobs in self._client.describe_jobs(jobs=jobIds)["jobs"]:
                 yield jobs
 
@@ -57,6 +108,11 @@ class BatchClient(object):
     def job(self):
         return BatchJob(self._client)
 
+    def terminate_job(self, job_id):
+        self._client.terminate_job(
+            jobId=job_id, reason="Metaflow initiated job termination."
+        )
+
     def attach_job(self, job_id):
         job = RunningJob(job_id, self._client)
         return job.update()
@@ -117,16 +173,23 @@ class BatchJob(object):
             # environment platform, so let's just default to EC2 for now.
             platform = "EC2"
         else:
-            response = self._client.describe_job_queues(jobQueues=[job_queue])
-            if len(response["jobQueues"]) == 0:
-                raise BatchJobException("AWS Batch Job Queue %s not found." % job_queue)
-            compute_environment = response["jobQueues"][0]["computeEnvironmentOrder"][
-                0
-            ]["computeEnvironment"]
-            response = self._client.describe_compute_environments(
-                computeEnvironments=[compute_environment]
-            )
-            platform = response["computeEnvironments"][0]["computeResources"]["type"]
+            platform = _cache_get(_platform_cache, job_queue)
+            if platform is None:
+                response = self._client.describe_job_queues(jobQueues=[job_queue])
+                if len(response["jobQueues"]) == 0:
+                    raise BatchJobException(
+                        "AWS Batch Job Queue %s not found." % job_queue
+                    )
+                compute_environment = response["jobQueues"][0][
+                    "computeEnvironmentOrder"
+                ][0]["computeEnvironment"]
+                response = self._client.describe_compute_environments(
+                    computeEnvironments=[compute_environment]
+                )
+                platform = response["computeEnvironments"][0]["computeResources"][
+                    "type"
+                ]
+                _cache_put(_platform_cache, job_queue, platform)
 
         # compose job definition
         job_definition = {
@@ -220,10 +283,15 @@ class BatchJob(object):
             "metaflow_%s"
             % hashlib.sha224(str(job_definition).encode("utf-8")).hexdigest()
         )
+        job_definition_arn = _cache_get(_job_definition_cache, def_name)
+        if job_definition_arn is not None:
+            return job_definition_arn
         payload = {"jobDefinitionName": def_name, "status": "ACTIVE"}
         response = self._client.describe_job_definitions(**payload)
         if len(response["jobDefinitions"]) > 0:
-            return response["jobDefinitions"][0]["jobDefinitionArn"]
+            job_definition_arn = response["jobDefinitions"][0]["jobDefinitionArn"]
+            _cache_put(_job_definition_cache, def_name, job_definition_arn)
+            return job_definition_arn
 
         # else create a job definition
         job_definition["jobDefinitionName"] = def_name
@@ -240,6 +308,7 @@ class BatchJob(object):
                 )
             else:
                 raise ex
+        _cache_put(_job_definition_cache, def_name, response["jobDefinitionArn"])
         return response["jobDefinitionArn"]
 
     def job_def(